@@ -2,8 +2,21 @@
 Constants for each Hebrew character and classes to represent them, and metadata about them.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Union
+from types import MappingProxyType
+from typing import (
+    Final,
+    Optional,
+    List,
+    Dict,
+    FrozenSet,
+    Mapping,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from hebrew.gematria import (
     MISPAR_HECHRACHI,
@@ -31,7 +44,7 @@ from hebrew.gematria import (
 #    `Hebrew.get_gematria_value(type=Gematria.MisparGadol)`.
 #     - This is a bit tricky because the gematria value of a letter is not a single value, there are different values
 #       used by different systems.
-@dataclass
+@dataclass(frozen=True)
 class BaseHebrewChar:
     """
     Base class with the metadata that all Hebrew characters share.
@@ -52,33 +65,54 @@ class BaseHebrewChar:
     for the Mispar Shemi Gematria method.
     """
 
-    name_alts: Optional[List[str]] = None
+    name_alts: Tuple[str, ...] = ()
     """Alternative names of the character in English."""
 
-    hebrew_name_alts: Optional[List[str]] = None
+    hebrew_name_alts: Tuple[str, ...] = ()
     """Alternative names of the character in Hebrew."""
 
+    def __post_init__(self):
+        # Intern the strings so equal values share one object and compare by identity first.
+        object.__setattr__(self, "char", sys.intern(self.char))
+        object.__setattr__(self, "name", sys.intern(self.name))
+        if self.hebrew_name is not None:
+            object.__setattr__(self, "hebrew_name", sys.intern(self.hebrew_name))
+        object.__setattr__(
+            self, "name_alts", tuple(sys.intern(n) for n in self.name_alts or ())
+        )
+        object.__setattr__(
+            self,
+            "hebrew_name_alts",
+            tuple(sys.intern(n) for n in self.hebrew_name_alts or ()),
+        )
+
+        # The names are read on every search, so they are built once here rather than on each access.
+        object.__setattr__(
+            self, "_hebrew_names", (self.hebrew_name, *self.hebrew_name_alts)
+        )
+        object.__setattr__(self, "_names", (self.name, *self.name_alts))
+
     @property
-    def hebrew_names(self) -> List[str]:
+    def hebrew_names(self) -> Tuple[Optional[str], ...]:
         """
         All Hebrew names for this character.
-        :return: A list of all Hebrew names for this character made up of the `hebrew_name` and `hebrew_name_alts`.
+        :return: A tuple of all Hebrew names for this character made up of the `hebrew_name` and `hebrew_name_alts`.
         """
-        return [self.hebrew_name] + (self.hebrew_name_alts or [])
+        return self._hebrew_names
 
     @property
-    def names(self) -> List[str]:
+    def names(self) -> Tuple[str, ...]:
         """
         All english names for this character.
-        :return: A list of all english names for this character made up of the `name` and `name_alts`.
+        :return: A tuple of all english names for this character made up of the `name` and `name_alts`.
         """
-        return [self.name] + (self.name_alts or [])
+        return self._names
 
     def __str__(self):
         return self.char
 
 
-@dataclass
+@dataclass(frozen=True)
 class HebrewChar(BaseHebrewChar):
     """
     A class representing characters that are part of the Hebrew alphabet (to the exclusion of Nekuds, etc).
@@ -223,7 +257,7 @@ class HebrewChar(BaseHebrewChar):
         return hash(self.char)
 
 
-@dataclass
+@dataclass(frozen=True)
 class YiddishChar(BaseHebrewChar):
     """
     A class representing special characters used in Yiddish text.
@@ -247,7 +281,7 @@ class YiddishChar(BaseHebrewChar):
         return hash(self.char)
 
 
-@dataclass
+@dataclass(frozen=True)
 class NiqqudChar(BaseHebrewChar):
     """
     A class representing Niqqud characters used in Hebrew and Yiddish text.
@@ -271,7 +305,7 @@ class NiqqudChar(BaseHebrewChar):
         return hash(self.char)
 
 
-@dataclass
+@dataclass(frozen=True)
 class TaamimChar(BaseHebrewChar):
     """
     A class representing the "Trup" or [Hebrew cantillation](https://en.wikipedia.org/wiki/Hebrew_cantillation)
@@ -296,7 +330,7 @@ class TaamimChar(BaseHebrewChar):
         return hash(self.char)
 
 
-@dataclass
+@dataclass(frozen=True)
 class OtherChar(BaseHebrewChar):
     """
     A class representing the "other" or "uncharacterized" characters used in Hebrew (and Yiddish) text.
@@ -326,576 +360,636 @@ class OtherChar(BaseHebrewChar):
 #  - Add the rest of the hebrew unicode characters as `HebrewChar` instances instead of plain strings`
 
 
-ALEPH = HebrewChar(char="א", name="Aleph", hebrew_name="אָלֶף", name_alts=["Alef"])
+ALEPH: Final[HebrewChar] = HebrewChar(
+    char="א", name="Aleph", hebrew_name="אָלֶף", name_alts=("Alef",)
+)
 """An instance of `HebrewChar` representing the letter `'א'`"""
 
-BET = HebrewChar(char="בּ", name="Bet", hebrew_name="בֵּית", hebrew_name_alts=["בת"])
+BET: Final[HebrewChar] = HebrewChar(
+    char="בּ", name="Bet", hebrew_name="בֵּית", hebrew_name_alts=("בת",)
+)
 """
 An instance of `HebrewChar` representing the letter **`'בּ'`**.
 *This is not strictly a letter, but is included because it is often treated as one.*
 """
 
-BES = BET
+BES: Final[HebrewChar] = BET
 """Simple pointer to `BET`."""
 
-VET = HebrewChar(char="ב", name="Vet", hebrew_name="בֵית", hebrew_name_alts=["בת"])
+VET: Final[HebrewChar] = HebrewChar(
+    char="ב", name="Vet", hebrew_name="בֵית", hebrew_name_alts=("בת",)
+)
 """An instance of `HebrewChar` representing the letter **`'ב'`**."""
 
-GIMEL = HebrewChar(
-    char="ג", name="Gimel", hebrew_name="גִימֵל", hebrew_name_alts=["גמל"]
+GIMEL: Final[HebrewChar] = HebrewChar(
+    char="ג", name="Gimel", hebrew_name="גִימֵל", hebrew_name_alts=("גמל",)
 )
 """An instance of `HebrewChar` representing the letter **`'ג'`**."""
 
-DALET = HebrewChar(
+DALET: Final[HebrewChar] = HebrewChar(
     char="ד",
     name="Dalet",
     hebrew_name="דָלֶת",
-    hebrew_name_alts=["דלית"],
-    name_alts=["Daled"],
+    hebrew_name_alts=("דלית",),
+    name_alts=("Daled",),
 )
 """An instance of `HebrewChar` representing the letter **`'ד'`**."""
 
-DALED = DALET
+DALED: Final[HebrewChar] = DALET
 """Simple pointer to `DALET`."""
 
-HE = HebrewChar(
+HE: Final[HebrewChar] = HebrewChar(
     char="ה",
     name="He",
     hebrew_name="הֵא",
-    hebrew_name_alts=["הי", "הה"],
-    name_alts=["Hei", "Hey"],
+    hebrew_name_alts=("הי", "הה"),
+    name_alts=("Hei", "Hey"),
 )
 """An instance of `HebrewChar` representing the letter **`'ה'`**."""
 
-HEI = HEY = HE
+HEI: Final[HebrewChar] = HE
 """Simple pointer to `HE`."""
 
-VAV = HebrewChar(
+HEY: Final[HebrewChar] = HE
+"""Simple pointer to `HE`."""
+
+VAV: Final[HebrewChar] = HebrewChar(
     char="ו",
     name="Vav",
     hebrew_name="וָו",
-    hebrew_name_alts=["ויו", "ואו"],
-    name_alts=["Vuv"],
+    hebrew_name_alts=("ויו", "ואו"),
+    name_alts=("Vuv",),
 )
 """An instance of `HebrewChar` representing the letter **`'ו'`**."""
 
-VUV = VAV
+VUV: Final[HebrewChar] = VAV
 """Simple pointer to `VAV`."""
 
-ZAYIN = HebrewChar(char="ז", name="Zayin", hebrew_name="זַיִן")
+ZAYIN: Final[HebrewChar] = HebrewChar(char="ז", name="Zayin", hebrew_name="זַיִן")
 """An instance of `HebrewChar` representing the letter **`'ז'`**."""
 
-CHET = HebrewChar(
+CHET: Final[HebrewChar] = HebrewChar(
     char="ח",
     name="Chet",
     hebrew_name="חֵית",
-    hebrew_name_alts=["חת"],
-    name_alts=["Het", "Ches"],
+    hebrew_name_alts=("חת",),
+    name_alts=("Het", "Ches"),
 )
 """An instance of `HebrewChar` representing the letter **`'ז'`**."""
 
-HET = CHES = CHET
+HET: Final[HebrewChar] = CHET
 """Simple pointer to `CHET`."""
 
-TET = HebrewChar(
-    char="ט", name="Tet", hebrew_name="טֵית", hebrew_name_alts=["טת"], name_alts=["Tes"]
+CHES: Final[HebrewChar] = CHET
+"""Simple pointer to `CHET`."""
+
+TET: Final[HebrewChar] = HebrewChar(
+    char="ט",
+    name="Tet",
+    hebrew_name="טֵית",
+    hebrew_name_alts=("טת",),
+    name_alts=("Tes",),
 )
 """An instance of `HebrewChar` representing the letter **`'ט'`**."""
 
-TES = TET
+TES: Final[HebrewChar] = TET
 """Simple pointer to `TET`."""
 
-YOD = HebrewChar(char="י", name="Yod", hebrew_name="יוֹד", name_alts=["Yud"])
+YOD: Final[HebrewChar] = HebrewChar(
+    char="י", name="Yod", hebrew_name="יוֹד", name_alts=("Yud",)
+)
 """An instance of `HebrewChar` representing the letter **`'י'`**."""
 
-YUD = YOD
+YUD: Final[HebrewChar] = YOD
 """Simple pointer to `YOD`."""
 
-CAF = HebrewChar(char="כּ", name="Kaf", hebrew_name="כַּף")
+CAF: Final[HebrewChar] = HebrewChar(char="כּ", name="Kaf", hebrew_name="כַּף")
 """
 An instance of `HebrewChar` representing the letter **`'כּ'`**.
 *This is not strictly a letter, but is included because it is often treated as one.*
 """
 
-KAF_SOFIT = HebrewChar(
+KAF_SOFIT: Final[HebrewChar] = HebrewChar(
     char="ךּ",
     name="Kaf Sofit",
     final_letter=True,
     hebrew_name="כַּף סוֹפִית",
-    name_alts=["Final Kaf"],
+    name_alts=("Final Kaf",),
 )
 """
 An instance of `HebrewChar` representing the letter **`'ךּ'`**.
 *This is not strictly a letter, but is included because it is often treated as one.*
 """
 
-FINAL_KAF = KAF_SOFIT
+FINAL_KAF: Final[HebrewChar] = KAF_SOFIT
 """Simple pointer to `KAF_SOFIT`."""
 
-CHAF = HebrewChar(char="כ", name="Chaf", hebrew_name="כַף")
+CHAF: Final[HebrewChar] = HebrewChar(char="כ", name="Chaf", hebrew_name="כַף")
 """An instance of `HebrewChar` representing the letter **`'כ'`**."""
 
-CHAF_SOFIT = HebrewChar(
+CHAF_SOFIT: Final[HebrewChar] = HebrewChar(
     char="ך",
     name="Chaf Sofit",
     final_letter=True,
     hebrew_name="כַף סוֹפִית",
-    name_alts=["Final Chaf"],
+    name_alts=("Final Chaf",),
 )
 """An instance of `HebrewChar` representing the letter **`'ך'`**."""
 
-FINAL_CHAF = CHAF_SOFIT
+FINAL_CHAF: Final[HebrewChar] = CHAF_SOFIT
 """Simple pointer to `CHAF_SOFIT`."""
 
-LAMED = HebrewChar(
+LAMED: Final[HebrewChar] = HebrewChar(
     char="ל",
     name="Lamed",
     hebrew_name="לָמֶד",
-    name_alts=["Lamid"],
+    name_alts=("Lamid",),
 )
 """An instance of `HebrewChar` representing the letter **`'ל'`**."""
 
-LAMID = LAMED
+LAMID: Final[HebrewChar] = LAMED
 """Simple pointer to `LAMED`."""
 
-MEM = HebrewChar(char="מ", name="Mem", hebrew_name="מֵם")
+MEM: Final[HebrewChar] = HebrewChar(char="מ", name="Mem", hebrew_name="מֵם")
 """An instance of `HebrewChar` representing the letter **`'מ'`**."""
 
-MEM_SOFIT = HebrewChar(
+MEM_SOFIT: Final[HebrewChar] = HebrewChar(
     char="ם",
     name="Mem Sofit",
     final_letter=True,
     hebrew_name="מֵם סוֹפִית",
-    name_alts=["Final Mem"],
+    name_alts=("Final Mem",),
 )
 """An instance of `HebrewChar` representing the letter **`'ם'`**."""
 
-FINAL_MEM = MEM_SOFIT
+FINAL_MEM: Final[HebrewChar] = MEM_SOFIT
 """Simple pointer to `MEM_SOFIT`."""
 
-NUN = HebrewChar(char="נ", name="Nun", hebrew_name="נוּן")
+NUN: Final[HebrewChar] = HebrewChar(char="נ", name="Nun", hebrew_name="נוּן")
 """An instance of `HebrewChar` representing the letter **`'נ'`**."""
 
-NUN_SOFIT = HebrewChar(
+NUN_SOFIT: Final[HebrewChar] = HebrewChar(
     char="ן",
     name="Nun Sofit",
     final_letter=True,
     hebrew_name="נוּן סוֹפִית",
-    name_alts=["Final Nun"],
+    name_alts=("Final Nun",),
 )
 """An instance of `HebrewChar` representing the letter **`'ן'`**."""
 
-FINAL_NUN = NUN_SOFIT
+FINAL_NUN: Final[HebrewChar] = NUN_SOFIT
 """Simple pointer to `NUN_SOFIT`."""
 
-SAMEKH = HebrewChar(
+SAMEKH: Final[HebrewChar] = HebrewChar(
     char="ס",
     name="Samekh",
     hebrew_name="סָמֶך",
-    name_alts=["Samach"],
+    name_alts=("Samach",),
 )
 """An instance of `HebrewChar` representing the letter **`'ס'`**."""
 
-SAMACH = SAMEKH
+SAMACH: Final[HebrewChar] = SAMEKH
 """Simple pointer to `SAMEKH`."""
 
-AYIN = HebrewChar(char="ע", name="Ayin", hebrew_name="עַיִן")
+AYIN: Final[HebrewChar] = HebrewChar(char="ע", name="Ayin", hebrew_name="עַיִן")
 """An instance of `HebrewChar` representing the letter **`'ע'`**."""
 
-PE = HebrewChar(char="פּ", name="Pe", hebrew_name_alts=["פי", "פה"])
+PE: Final[HebrewChar] = HebrewChar(char="פּ", name="Pe", hebrew_name_alts=("פי", "פה"))
 """
 An instance of `HebrewChar` representing the letter **`'פּ'`**.
 *This is not strictly a letter, but is included because it is often treated as one.*
 """
 
-FE = HebrewChar(char="פ", name="Fe", hebrew_name="פֵא", hebrew_name_alts=["פי", "פה"])
+FE: Final[HebrewChar] = HebrewChar(
+    char="פ", name="Fe", hebrew_name="פֵא", hebrew_name_alts=("פי", "פה")
+)
 """An instance of `HebrewChar` representing the letter **`'פ'`**."""
 
-PE_SOFIT = HebrewChar(
+PE_SOFIT: Final[HebrewChar] = HebrewChar(
     char="ףּ",
     name="Fe Sofit",
     final_letter=True,
     hebrew_name="פֵּא סוֹפִית",
-    name_alts=["Final Pe"],
+    name_alts=("Final Pe",),
 )
 """
 An instance of `HebrewChar` representing the letter **`'ףּ'`**.
 *This is not strictly a letter, but is included because it is often treated as one.*
 """
 
-FINAL_PE = PE_SOFIT
+FINAL_PE: Final[HebrewChar] = PE_SOFIT
 """Simple pointer to `PE_SOFIT`."""
 
-FE_SOFIT = HebrewChar(
+FE_SOFIT: Final[HebrewChar] = HebrewChar(
     char="ף",
     name="Fe Sofit",
     final_letter=True,
     hebrew_name="פֵא סוֹפִית",
-    name_alts=["Final Fe"],
+    name_alts=("Final Fe",),
 )
 """An instance of `HebrewChar` representing the letter **`'ף'`**."""
 
-FINAL_FE = FE_SOFIT
+FINAL_FE: Final[HebrewChar] = FE_SOFIT
 """Simple pointer to `FE_SOFIT`."""
 
-TSADI = HebrewChar(
+TSADI: Final[HebrewChar] = HebrewChar(
     char="צ",
     name="Tsadi",
     hebrew_name="צַדִי",
-    hebrew_name_alts=["צדיק"],
-    name_alts=["Tzadik"],
+    hebrew_name_alts=("צדיק",),
+    name_alts=("Tzadik",),
 )
 """An instance of `HebrewChar` representing the letter **`'צ'`**."""
 
-TZADIK = TSADI
+TZADIK: Final[HebrewChar] = TSADI
 """Simple pointer to `TSADI`."""
 
-TSADI_SOFIT = HebrewChar(
+TSADI_SOFIT: Final[HebrewChar] = HebrewChar(
     char="ץ",
     name="Tsadi Sofit",
     final_letter=True,
     hebrew_name="צַדִי סוֹפִית",
-    hebrew_name_alts=["צדיק סופית"],
+    hebrew_name_alts=("צדיק סופית",),
 )
 """An instance of `HebrewChar` representing the letter **`'ץ'`**."""
 
-FINAL_TSADI = TZADIK_SOFIT = FINAL_TZADIK = TSADI_SOFIT
+FINAL_TSADI: Final[HebrewChar] = TSADI_SOFIT
+"""Simple pointer to `TSADI_SOFIT`."""
+
+TZADIK_SOFIT: Final[HebrewChar] = TSADI_SOFIT
+"""Simple pointer to `TSADI_SOFIT`."""
+
+FINAL_TZADIK: Final[HebrewChar] = TSADI_SOFIT
 """Simple pointer to `TSADI_SOFIT`."""
 
-QOF = HebrewChar(char="ק", name="Qof", hebrew_name="קוֹף", name_alts=["Kuf"])
+QOF: Final[HebrewChar] = HebrewChar(
+    char="ק", name="Qof", hebrew_name="קוֹף", name_alts=("Kuf",)
+)
 """An instance of `HebrewChar` representing the letter **`'ק'`**."""
 
-KUF = QOF
+KUF: Final[HebrewChar] = QOF
 """Simple pointer to `TSADI_SOFIT`."""
 
-RESH = HebrewChar(char="ר", name="Resh", hebrew_name="רֵישׁ", hebrew_name_alts=["רש"])
+RESH: Final[HebrewChar] = HebrewChar(
+    char="ר", name="Resh", hebrew_name="רֵישׁ", hebrew_name_alts=("רש",)
+)
 """An instance of `HebrewChar` representing the letter **`'ר'`**."""
 
 # TODO: The naming here might need help. We should definitely support all 3 versions as this is likely to be found
 #  in text, but the naming might be unexpected.
-SHIN = HebrewChar(
-    char="שׁ", name="Shin", hebrew_name="שִׁן", hebrew_name_alts=["שִׁין"]
+SHIN: Final[HebrewChar] = HebrewChar(
+    char="שׁ", name="Shin", hebrew_name="שִׁן", hebrew_name_alts=("שִׁין",)
 )
 """
 An instance of `HebrewChar` representing the letter **`'שׁ'`**.
 *This is not strictly a letter, but is included because it is often treated as one.*
 """
 
-SIN = HebrewChar(char="שׂ", name="Sin", hebrew_name="שִׂן", hebrew_name_alts=["שִׂין"])
+SIN: Final[HebrewChar] = HebrewChar(
+    char="שׂ", name="Sin", hebrew_name="שִׂן", hebrew_name_alts=("שִׂין",)
+)
 """
 An instance of `HebrewChar` representing the letter **`'שׂ'`**.
 *This is not strictly a letter, but is included because it is often treated as one.*
 """
 
-PLAIN_SIN = HebrewChar(
-    char="ש", name="Plain Sin", hebrew_name="שִׂן", hebrew_name_alts=["שִׂין"]
+PLAIN_SIN: Final[HebrewChar] = HebrewChar(
+    char="ש", name="Plain Sin", hebrew_name="שִׂן", hebrew_name_alts=("שִׂין",)
 )
 """An instance of `HebrewChar` representing the letter **`'ש'`**."""
 
-TAV = HebrewChar(
+TAV: Final[HebrewChar] = HebrewChar(
     char="תּ",
     name="Tav",
     hebrew_name="תּו",
-    hebrew_name_alts=["תיו", "תאו"],
-    name_alts=["Taf"],
+    hebrew_name_alts=("תיו", "תאו"),
+    name_alts=("Taf",),
 )
 """
 An instance of `HebrewChar` representing the letter **`'תּ'`**.
 *This is not strictly a letter, but is included because it is often treated as one.*
 """
 
-TAF = TAV
+TAF: Final[HebrewChar] = TAV
 """Simple pointer to `TAV`."""
 
-SAV = HebrewChar(
+SAV: Final[HebrewChar] = HebrewChar(
     char="ת",
     name="Sav",
     hebrew_name="תָו",
-    name_alts=["Saf"],
-    hebrew_name_alts=["תיו", "תאו"],
+    name_alts=("Saf",),
+    hebrew_name_alts=("תיו", "תאו"),
 )
 """An instance of `HebrewChar` representing the letter **`'ת'`**."""
 
-ALEPH_SYMBOL = HebrewChar("ℵ", name="Aleph Symbol")
+ALEPH_SYMBOL: Final[HebrewChar] = HebrewChar("ℵ", name="Aleph Symbol")
 """An instance of `HebrewChar` representing the letter **`'ℵ'`**. This is a rarely used special character."""
-BET_SYMBOL = HebrewChar("ℶ", name="Bet Symbol")
+BET_SYMBOL: Final[HebrewChar] = HebrewChar("ℶ", name="Bet Symbol")
 """An instance of `HebrewChar` representing the letter **`'ℶ'`**. This is a rarely used special character."""
-GIMEL_SYMBOL = HebrewChar("ℷ", name="Gimel Symbol")
+GIMEL_SYMBOL: Final[HebrewChar] = HebrewChar("ℷ", name="Gimel Symbol")
 """An instance of `HebrewChar` representing the letter **`'ℷ'`**. This is a rarely used special character."""
-DALET_SYMBOL = HebrewChar("ℸ", name="Dalet Symbol")
+DALET_SYMBOL: Final[HebrewChar] = HebrewChar("ℸ", name="Dalet Symbol")
 """An instance of `HebrewChar` representing the letter **`'ℸ'`**. This is a rarely used special character."""
-YOD_HIRIQ = HebrewChar("יִ", name="Yod with Hiriq")
+YOD_HIRIQ: Final[HebrewChar] = HebrewChar("יִ", name="Yod with Hiriq")
 """An instance of `HebrewChar` representing the letter **`'יִ'`**. This is a rarely used special character."""
-YOD_YOD_PATAH = YiddishChar("ײַ", name="Yod Yod Patah")
+YOD_YOD_PATAH: Final[YiddishChar] = YiddishChar("ײַ", name="Yod Yod Patah")
 """An instance of `YiddishChar` representing the letter **`'ײַ'`**. This is a rarely used special character."""
-YOD_YOD_PATAH2 = YiddishChar("ײַ", name="Yod Yod Patah")
+YOD_YOD_PATAH2: Final[YiddishChar] = YiddishChar("ײַ", name="Yod Yod Patah")
 """An instance of `YiddishChar` representing the letters **`'ײַ'`**. This is a variation of YOD_YOD_PATAH made up of a double Yud, and a Patah."""
-AYIN_ALT = HebrewChar("ﬠ", name="Alternative Ayin")
+AYIN_ALT: Final[HebrewChar] = HebrewChar("ﬠ", name="Alternative Ayin")
 """An instance of `HebrewChar` representing the letter **`'ﬠ'`**. This is a rarely used special character."""
-ALEF_WIDE = HebrewChar("ﬡ", name="Wide Alef")
+ALEF_WIDE: Final[HebrewChar] = HebrewChar("ﬡ", name="Wide Alef")
 """An instance of `HebrewChar` representing the letter **`'ﬡ'`**. This is a rarely used special character."""
-DALET_WIDE = HebrewChar("ﬢ", name="Wide Dalet")
+DALET_WIDE: Final[HebrewChar] = HebrewChar("ﬢ", name="Wide Dalet")
 """An instance of `HebrewChar` representing the letter **`'ﬢ'`**. This is a rarely used special character."""
-HE_WIDE = HebrewChar("ﬣ", name="Wide He")
+HE_WIDE: Final[HebrewChar] = HebrewChar("ﬣ", name="Wide He")
 """An instance of `HebrewChar` representing the letter **`'ﬣ'`**. This is a rarely used special character."""
-KAF_WIDE = HebrewChar("ﬤ", name="Wide Kaf")
+KAF_WIDE: Final[HebrewChar] = HebrewChar("ﬤ", name="Wide Kaf")
 """An instance of `HebrewChar` representing the letter **`'ﬤ'`**. This is a rarely used special character."""
-LAMED_WIDE = HebrewChar("ﬥ", name="Wide Lamed")
+LAMED_WIDE: Final[HebrewChar] = HebrewChar("ﬥ", name="Wide Lamed")
 """An instance of `HebrewChar` representing the letter **`'ﬥ'`**. This is a rarely used special character."""
-FINAL_MEM_WIDE = HebrewChar("ﬦ", name="Wide Final Mem")
+FINAL_MEM_WIDE: Final[HebrewChar] = HebrewChar("ﬦ", name="Wide Final Mem")
 """An instance of `HebrewChar` representing the letter **`'ﬦ'`**. This is a rarely used special character."""
-RESH_WIDE = HebrewChar("ﬧ", name="Wide Resh")
+RESH_WIDE: Final[HebrewChar] = HebrewChar("ﬧ", name="Wide Resh")
 """An instance of `HebrewChar` representing the letter **`'ﬧ'`**. This is a rarely used special character."""
-TAV_WIDE = HebrewChar("ﬨ", name="Wide Tav")
+TAV_WIDE: Final[HebrewChar] = HebrewChar("ﬨ", name="Wide Tav")
 """An instance of `HebrewChar` representing the letter **`'ﬨ'`**. This is a rarely used special character."""
-SHIN_SHIN_DOT = HebrewChar("שׁ", name="Shin with Shin Dot")
+SHIN_SHIN_DOT: Final[HebrewChar] = HebrewChar("שׁ", name="Shin with Shin Dot")
 """An instance of `HebrewChar` representing the letter **`'שׁ'`**. This is a rarely used special character."""
-SHIN_SIN_DOT = HebrewChar("שׂ", name="Shin with Sin Dot")
+SHIN_SIN_DOT: Final[HebrewChar] = HebrewChar("שׂ", name="Shin with Sin Dot")
 """An instance of `HebrewChar` representing the letter **`'שׂ'`**. This is a rarely used special character."""
-SHIN_DAGESH_SHIN_DOT = HebrewChar("שּׁ", name="Shin with Dagesh and Shin Dot")
+SHIN_DAGESH_SHIN_DOT: Final[HebrewChar] = HebrewChar(
+    "שּׁ", name="Shin with Dagesh and Shin Dot"
+)
 """An instance of `HebrewChar` representing the letter **`'שּׁ'`**. This is a rarely used special character."""
-SHIN_DAGESH_SIN_DOT = HebrewChar("שּׂ", name="Shin with Dagesh and Sin Dot")
+SHIN_DAGESH_SIN_DOT: Final[HebrewChar] = HebrewChar(
+    "שּׂ", name="Shin with Dagesh and Sin Dot"
+)
 """An instance of `HebrewChar` representing the letter **`'שּׂ'`**. This is a rarely used special character."""
-ALEF_PATAH = HebrewChar("אַ", name="Alef with Patah")
+ALEF_PATAH: Final[HebrewChar] = HebrewChar("אַ", name="Alef with Patah")
 """An instance of `HebrewChar` representing the letter **`'אַ'`**. This is a rarely used special character."""
-ALEF_QAMATZ = HebrewChar("אָ", name="Alef with Qamats")
+ALEF_QAMATZ: Final[HebrewChar] = HebrewChar("אָ", name="Alef with Qamats")
 """An instance of `HebrewChar` representing the letter **`'אָ'`**. This is a rarely used special character."""
-ALEF_MAPIQ = HebrewChar("אּ", name="Alef with Mapiq")
+ALEF_MAPIQ: Final[HebrewChar] = HebrewChar("אּ", name="Alef with Mapiq")
 """An instance of `HebrewChar` representing the letter **`'אּ'`**. This is a rarely used special character."""
-BET_DAGESH = HebrewChar("בּ", name="Bet with Dagesh")
+BET_DAGESH: Final[HebrewChar] = HebrewChar("בּ", name="Bet with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'בּ'`**. This is a rarely used special character."""
-GIMEL_DAGESH = HebrewChar("גּ", name="Gimel with Dagesh")
+GIMEL_DAGESH: Final[HebrewChar] = HebrewChar("גּ", name="Gimel with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'גּ'`**. This is a rarely used special character."""
-DALET_DAGESH = HebrewChar("דּ", name="Dalet with Dagesh")
+DALET_DAGESH: Final[HebrewChar] = HebrewChar("דּ", name="Dalet with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'דּ'`**. This is a rarely used special character."""
-HE_MAPIQ = HebrewChar("הּ", name="He with Mapiq")
+HE_MAPIQ: Final[HebrewChar] = HebrewChar("הּ", name="He with Mapiq")
 """An instance of `HebrewChar` representing the letter **`'הּ'`**. This is a rarely used special character."""
-VAV_DAGESH = HebrewChar("וּ", name="Vav with Dagesh")
+VAV_DAGESH: Final[HebrewChar] = HebrewChar("וּ", name="Vav with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'וּ'`**. This is a rarely used special character."""
-ZAYIN_DAGESH = HebrewChar("זּ", name="Zayin with Dagesh")
+ZAYIN_DAGESH: Final[HebrewChar] = HebrewChar("זּ", name="Zayin with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'זּ'`**. This is a rarely used special character."""
-TET_DAGESH = HebrewChar("טּ", name="Tet with Dagesh")
+TET_DAGESH: Final[HebrewChar] = HebrewChar("טּ", name="Tet with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'טּ'`**. This is a rarely used special character."""
-YOD_DAGESH = HebrewChar("יּ", name="Yod with Dagesh")
+YOD_DAGESH: Final[HebrewChar] = HebrewChar("יּ", name="Yod with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'יּ'`**. This is a rarely used special character."""
-FINAL_KAF_DAGESH = HebrewChar("ךּ", name="Final Kaf with Dagesh")
+FINAL_KAF_DAGESH: Final[HebrewChar] = HebrewChar("ךּ", name="Final Kaf with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'ךּ'`**. This is a rarely used special character."""
-KAF_DAGESH = HebrewChar("כּ", name="Kaf with Dagesh")
+KAF_DAGESH: Final[HebrewChar] = HebrewChar("כּ", name="Kaf with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'כּ'`**. This is a rarely used special character."""
-LAMED_DAGESH = HebrewChar("לּ", name="Lamed with Dagesh")
+LAMED_DAGESH: Final[HebrewChar] = HebrewChar("לּ", name="Lamed with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'לּ'`**. This is a rarely used special character."""
-MEM_DAGESH = HebrewChar("מּ", name="Mem with Dagesh")
+MEM_DAGESH: Final[HebrewChar] = HebrewChar("מּ", name="Mem with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'מּ'`**. This is a rarely used special character."""
-NUN_DAGESH = HebrewChar("נּ", name="Nun with Dagesh")
+NUN_DAGESH: Final[HebrewChar] = HebrewChar("נּ", name="Nun with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'נּ'`**. This is a rarely used special character."""
-SAMEKH_DAGESH = HebrewChar("סּ", name="Samekh with Dagesh")
+SAMEKH_DAGESH: Final[HebrewChar] = HebrewChar("סּ", name="Samekh with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'סּ'`**. This is a rarely used special character."""
-FINAL_PE_DAGESH = HebrewChar("ףּ", name="Final Pe with Dagesh")
+FINAL_PE_DAGESH: Final[HebrewChar] = HebrewChar("ףּ", name="Final Pe with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'ףּ'`**. This is a rarely used special character."""
-PE_DAGESH = HebrewChar("פּ", name="Pe with Dagesh")
+PE_DAGESH: Final[HebrewChar] = HebrewChar("פּ", name="Pe with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'פּ'`**. This is a rarely used special character."""
-TSADI_DAGESH = HebrewChar("צּ", name="Tsadi with Dagesh")
+TSADI_DAGESH: Final[HebrewChar] = HebrewChar("צּ", name="Tsadi with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'צּ'`**. This is a rarely used special character."""
-QOF_DAGESH = HebrewChar("קּ", name="Qof with Dagesh")
+QOF_DAGESH: Final[HebrewChar] = HebrewChar("קּ", name="Qof with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'קּ'`**. This is a rarely used special character."""
-RESH_DAGESH = HebrewChar("רּ", name="Resh with Dagesh")
+RESH_DAGESH: Final[HebrewChar] = HebrewChar("רּ", name="Resh with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'רּ'`**. This is a rarely used special character."""
-SHIN_DAGESH = HebrewChar("שּ", name="Shin with Dagesh")
+SHIN_DAGESH: Final[HebrewChar] = HebrewChar("שּ", name="Shin with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'שּ'`**. This is a rarely used special character."""
-TAV_DAGESH = HebrewChar("תּ", name="Tav with Dagesh")
+TAV_DAGESH: Final[HebrewChar] = HebrewChar("תּ", name="Tav with Dagesh")
 """An instance of `HebrewChar` representing the letter **`'תּ'`**. This is a rarely used special character."""
-VAV_HOLAM = HebrewChar("וֹ", name="Vav with Holam")
+VAV_HOLAM: Final[HebrewChar] = HebrewChar("וֹ", name="Vav with Holam")
 """An instance of `HebrewChar` representing the letter **`'וֹ'`**. This is a rarely used special character."""
-BET_RAFE = HebrewChar("בֿ", name="Bet with Rafe")
+BET_RAFE: Final[HebrewChar] = HebrewChar("בֿ", name="Bet with Rafe")
 """An instance of `HebrewChar` representing the letter **`'בֿ'`**. This is a rarely used special character."""
-KAF_RAFE = HebrewChar("כֿ", name="Kaf with Rafe")
+KAF_RAFE: Final[HebrewChar] = HebrewChar("כֿ", name="Kaf with Rafe")
 """An instance of `HebrewChar` representing the letter **`'כֿ'`**. This is a rarely used special character."""
-PE_RAFE = HebrewChar("פֿ", name="Pe with Rafe")
+PE_RAFE: Final[HebrewChar] = HebrewChar("פֿ", name="Pe with Rafe")
 """An instance of `HebrewChar` representing the letter **`'פֿ'`**. This is a rarely used special character."""
-ALEPH_LAMED = HebrewChar("ﭏ", name="Alef Lamed")
+ALEPH_LAMED: Final[HebrewChar] = HebrewChar("ﭏ", name="Alef Lamed")
 """An instance of `HebrewChar` representing the letter **`'ﭏ'`**. This is a rarely used special character."""
 
-SAF = SAV
+SAF: Final[HebrewChar] = SAV
 """Simple pointer to `SAV`."""
 
-DOUBLE_YOD = YiddishChar(
+DOUBLE_YOD: Final[YiddishChar] = YiddishChar(
     char="ײ",
     name="Double Yod",
-    name_alts=["Saf"],
+    name_alts=("Saf",),
 )
 """An instance of `YiddishChar` representing the letter **`'ײ'`**."""
 
-DOUBLE_YUD = DOUBLE_YOD
+DOUBLE_YUD: Final[YiddishChar] = DOUBLE_YOD
 """Simple pointer to `DOUBLE_YOD`."""
 
-DOUBLE_VAV = YiddishChar(
+DOUBLE_VAV: Final[YiddishChar] = YiddishChar(
     char="װ",
     name="Double Vav",
-    name_alts=["Double Vuv"],
+    name_alts=("Double Vuv",),
 )
 """An instance of `YiddishChar` representing the letter **`'װ'`**."""
 
-DOUBLE_VUV = DOUBLE_VAV
+DOUBLE_VUV: Final[YiddishChar] = DOUBLE_VAV
 """Simple pointer to `DOUBLE_VAV`."""
 
-VAV_YOD = YiddishChar(char="ױ", name="Vav Yod")
+VAV_YOD: Final[YiddishChar] = YiddishChar(char="ױ", name="Vav Yod")
 """An instance of `YiddishChar` representing the letter **`'ױ'`**."""
 
-VAV_YUD = VUV_YOD = VUV_YUD = VAV_YOD
+VAV_YUD: Final[YiddishChar] = VAV_YOD
+"""Simple pointer to `VAV_YOD`."""
+
+VUV_YOD: Final[YiddishChar] = VAV_YOD
+"""Simple pointer to `VAV_YOD`."""
+
+VUV_YUD: Final[YiddishChar] = VAV_YOD
 """Simple pointer to `VAV_YOD`."""
 
-YOD_TRIANGLE = HebrewChar(char="ׯ", name="Yod Triangle", name_alts=["Yud Triangle"])
+YOD_TRIANGLE: Final[HebrewChar] = HebrewChar(
+    char="ׯ", name="Yod Triangle", name_alts=("Yud Triangle",)
+)
 """An instance of `HebrewChar` representing the letter **`'ׯ'`**."""
 
-YUD_TRIANGLE = YOD_TRIANGLE
+YUD_TRIANGLE: Final[HebrewChar] = YOD_TRIANGLE
 """Simple pointer to `YOD_TRIANGLE`."""
 
 # Niqqudot or Vowel characters
-SIN_DOT = NiqqudChar(char="ׂ", name="Sin Dot")
+SIN_DOT: Final[NiqqudChar] = NiqqudChar(char="ׂ", name="Sin Dot")
 """An instance of `NiqqudChar` representing the Niqqud **`'ׂ'`**."""
-SHIN_DOT = NiqqudChar(char="ׁ", name="Shin Dot")
+SHIN_DOT: Final[NiqqudChar] = NiqqudChar(char="ׁ", name="Shin Dot")
 """An instance of `NiqqudChar` representing the Niqqud **`'ׁ'`**."""
-DAGESH = NiqqudChar(char="ּ", name="Dagesh")
+DAGESH: Final[NiqqudChar] = NiqqudChar(char="ּ", name="Dagesh")
 """An instance of `NiqqudChar` representing the Niqqud **`'ּ'`**."""
-QUBUTS = NiqqudChar(char="ֻ", name="Qubuts", name_alts=["Kubutz"])
+QUBUTS: Final[NiqqudChar] = NiqqudChar(char="ֻ", name="Qubuts", name_alts=("Kubutz",))
 """An instance of `NiqqudChar` representing the Niqqud **`'ֻ'`**."""
-KUBUTZ = QUBUTS
+KUBUTZ: Final[NiqqudChar] = QUBUTS
 """Simple pointer to `QUBUTS`"""
-SHURUK = NiqqudChar(char="וּ", name="Shuruk")
+SHURUK: Final[NiqqudChar] = NiqqudChar(char="וּ", name="Shuruk")
 """An instance of `NiqqudChar` representing the Niqqud **`'וּ'`**."""
-HOLAM = NiqqudChar(char="ֹ", name="Holam")
+HOLAM: Final[NiqqudChar] = NiqqudChar(char="ֹ", name="Holam")
 """An instance of `NiqqudChar` representing the Niqqud **`'ֹ'`**."""
-QAMATS = NiqqudChar(char="ָ", name="Qamats", name_alts=["Kumatz"])
+QAMATS: Final[NiqqudChar] = NiqqudChar(char="ָ", name="Qamats", name_alts=("Kumatz",))
 """An instance of `NiqqudChar` representing the Niqqud **`'ָ'`**."""
-KUMATZ = QAMATS
+KUMATZ: Final[NiqqudChar] = QAMATS
 """Simple pointer to `QAMATS`"""
-QAMATS_KATAN = NiqqudChar(char="ׇ", name="Qamats Qatan", name_alts=["Kumatz Katan"])
+QAMATS_KATAN: Final[NiqqudChar] = NiqqudChar(
+    char="ׇ", name="Qamats Qatan", name_alts=("Kumatz Katan",)
+)
 """An instance of `NiqqudChar` representing the Niqqud **`'ׇ'`**."""
-PATAH = NiqqudChar(char="ַ", name="Patah", name_alts=["Patach"])
+PATAH: Final[NiqqudChar] = NiqqudChar(char="ַ", name="Patah", name_alts=("Patach",))
 """An instance of `NiqqudChar` representing the Niqqud **`'ַ'`**."""
-PATACH = PATAH
+PATACH: Final[NiqqudChar] = PATAH
 """Simple pointer to `PATAH`"""
-SEGOL = NiqqudChar(char="ֶ", name="Segol")
+SEGOL: Final[NiqqudChar] = NiqqudChar(char="ֶ", name="Segol")
 """An instance of `NiqqudChar` representing the Niqqud **`'ֶ'`**."""
-TSERE = NiqqudChar(char="ֵ", name="Tsere")
+TSERE: Final[NiqqudChar] = NiqqudChar(char="ֵ", name="Tsere")
 """An instance of `NiqqudChar` representing the Niqqud **`'ֵ'`**."""
-HIRIQ = NiqqudChar(char="ִ", name="Hiriq", name_alts=["Chirik"])
+HIRIQ: Final[NiqqudChar] = NiqqudChar(char="ִ", name="Hiriq", name_alts=("Chirik",))
 """An instance of `NiqqudChar` representing the Niqqud **`'ִ'`**."""
-CHIRIK = HIRIQ
+CHIRIK: Final[NiqqudChar] = HIRIQ
 """Simple pointer to `HIRIQ`"""
-HATAF_QAMATS = NiqqudChar(char="ֳ", name="Hataf Qamatz", name_alts=["Hataf Kumatz"])
+HATAF_QAMATS: Final[NiqqudChar] = NiqqudChar(
+    char="ֳ", name="Hataf Qamatz", name_alts=("Hataf Kumatz",)
+)
 """An instance of `NiqqudChar` representing the Niqqud **`'ֳ'`**."""
-HATAF_PATAH = NiqqudChar(char="ֲ", name="Hataf Patah", name_alts=["Hataf Patach"])
+HATAF_PATAH: Final[NiqqudChar] = NiqqudChar(
+    char="ֲ", name="Hataf Patah", name_alts=("Hataf Patach",)
+)
 """An instance of `NiqqudChar` representing the Niqqud **`'ֲ'`**."""
-HATAF_SEGOL = NiqqudChar(char="ֱ", name="Hataf Segol")
+HATAF_SEGOL: Final[NiqqudChar] = NiqqudChar(char="ֱ", name="Hataf Segol")
 """An instance of `NiqqudChar` representing the Niqqud **`'ֱ'`**."""
-SHEVA = NiqqudChar(char="ְ", name="Sheva", name_alts=["Shivah"])
+SHEVA: Final[NiqqudChar] = NiqqudChar(char="ְ", name="Sheva", name_alts=("Shivah",))
 """An instance of `NiqqudChar` representing the Niqqud **`'ְ'`**."""
-SHIVAH = SHEVA
+SHIVAH: Final[NiqqudChar] = SHEVA
 """Simple pointer to `SHEVA`"""
-UPPER_DOT = NiqqudChar(char="ׄ", name="Upper Dot")
+UPPER_DOT: Final[NiqqudChar] = NiqqudChar(char="ׄ", name="Upper Dot")
 """An instance of `NiqqudChar` representing the Niqqud **`'ׄ'`**."""
-HOLAM_HASER = NiqqudChar(char="ֺ", name="Holam Haser")
+HOLAM_HASER: Final[NiqqudChar] = NiqqudChar(char="ֺ", name="Holam Haser")
 """An instance of `NiqqudChar` representing the Niqqud **`'ֺ'`**."""
-LOWER_DOT = NiqqudChar(char="ׅ", name="Lower Dot")
+LOWER_DOT: Final[NiqqudChar] = NiqqudChar(char="ׅ", name="Lower Dot")
 """An instance of `NiqqudChar` representing the Niqqud **`'ׅ'`**."""
 
 # Other characters
-MAQAF = OtherChar(char="־", name="Maqaf")
+MAQAF: Final[OtherChar] = OtherChar(char="־", name="Maqaf")
 """An instance of `TaamimChar` representing the character **`'־'`**."""
-PASEQ = OtherChar(char="׀", name="Paseq")
+PASEQ: Final[OtherChar] = OtherChar(char="׀", name="Paseq")
 """An instance of `TaamimChar` representing the character **`'׀'`**."""
-SOF_PASSUK = OtherChar(char="׃", name="Sof Passuk")
+SOF_PASSUK: Final[OtherChar] = OtherChar(char="׃", name="Sof Passuk")
 """An instance of `TaamimChar` representing the character **`'׃'`**."""
-GERSHAYIM = OtherChar(char="״", name="Gershayim")
+GERSHAYIM: Final[OtherChar] = OtherChar(char="״", name="Gershayim")
 """An instance of `OtherChar` representing the character **`'״'`**."""
-GERESH = OtherChar(char="׳", name="Geresh")
+GERESH: Final[OtherChar] = OtherChar(char="׳", name="Geresh")
 """An instance of `OtherChar` representing the character **`'׳'`**."""
-ALTERNATIVE_PLUS_SIGN = OtherChar(char="﬩", name="Alternative Plus Sign")
+ALTERNATIVE_PLUS_SIGN: Final[OtherChar] = OtherChar(
+    char="﬩", name="Alternative Plus Sign"
+)
 """An instance of `OtherChar` representing the character **`'﬩'`**."""
-INVERTED_NUN = OtherChar(
-    char="׆", name="Inverted Nun", hebrew_name='נו"ן מנוזרת', name_alts=["Nun Hafukha"]
+INVERTED_NUN: Final[OtherChar] = OtherChar(
+    char="׆", name="Inverted Nun", hebrew_name='נו"ן מנוזרת', name_alts=("Nun Hafukha",)
 )
 """An instance of `OtherChar` representing the letter **`'׆'`**. This is a rarely used special character."""
 
-NUN_HAFUKHA = INVERTED_NUN
+NUN_HAFUKHA: Final[OtherChar] = INVERTED_NUN
 """Simple pointer to `INVERTED_NUN`."""
 
 # Taamim characters
-ETNAHTA = TaamimChar(char="֑", name="Etnahta")
+ETNAHTA: Final[TaamimChar] = TaamimChar(char="֑", name="Etnahta")
 """An instance of `TaamimChar` representing the Ta'amim **`'֑'`**."""
-SEGOL_TOP = TaamimChar(char="֒", name="Segol Top")
+SEGOL_TOP: Final[TaamimChar] = TaamimChar(char="֒", name="Segol Top")
 """An instance of `TaamimChar` representing the Ta'amim **`'֒'`**."""
-SHALSHELET = TaamimChar(char="֓", name="Shalshelet")
+SHALSHELET: Final[TaamimChar] = TaamimChar(char="֓", name="Shalshelet")
 """An instance of `TaamimChar` representing the Ta'amim **`'֓'`**."""
-ZAQEF_QATAN = TaamimChar(char="֔", name="Zaqef Qatan")
+ZAQEF_QATAN: Final[TaamimChar] = TaamimChar(char="֔", name="Zaqef Qatan")
 """An instance of `TaamimChar` representing the Ta'amim **`'֔'`**."""
-ZAQEF_GADOL = TaamimChar(char="֕", name="Zaqef Gadol")
+ZAQEF_GADOL: Final[TaamimChar] = TaamimChar(char="֕", name="Zaqef Gadol")
 """An instance of `TaamimChar` representing the Ta'amim **`'֕'`**."""
-TIFCHA = TaamimChar(char="֖", name="Tifcha")
+TIFCHA: Final[TaamimChar] = TaamimChar(char="֖", name="Tifcha")
 """An instance of `TaamimChar` representing the Ta'amim **`'֖'`**."""
-REVIA = TaamimChar(char="֗", name="Revia")
+REVIA: Final[TaamimChar] = TaamimChar(char="֗", name="Revia")
 """An instance of `TaamimChar` representing the Ta'amim **`'֗'`**."""
-ZINOR = TaamimChar(char="֮", name="Zinor")
+ZINOR: Final[TaamimChar] = TaamimChar(char="֮", name="Zinor")
 """An instance of `TaamimChar` representing the Ta'amim **`'֮'`**."""
-PASHTA = TaamimChar(char="֙", name="Pashta")
+PASHTA: Final[TaamimChar] = TaamimChar(char="֙", name="Pashta")
 """An instance of `TaamimChar` representing the Ta'amim **`'֙'`**."""
-PASHTA_2 = TaamimChar(char="֨", name="Pashta 2", name_alts=["Qadma"])
+PASHTA_2: Final[TaamimChar] = TaamimChar(
+    char="֨", name="Pashta 2", name_alts=("Qadma",)
+)
 """An instance of `TaamimChar` representing the Ta'amim **`'֨'`**."""
-QADMA = PASHTA_2
+QADMA: Final[TaamimChar] = PASHTA_2
 """Simple pointer to `PASHTA_2` since they share the same Unicode character."""
-YETIV = TaamimChar(char="֚", name="Yetiv")
+YETIV: Final[TaamimChar] = TaamimChar(char="֚", name="Yetiv")
 """An instance of `TaamimChar` representing the Ta'amim **`'֚'`**."""
-TEVIR = TaamimChar(char="֛", name="Tevir")
+TEVIR: Final[TaamimChar] = TaamimChar(char="֛", name="Tevir")
 """An instance of `TaamimChar` representing the Ta'amim **`'֛'`**."""
-PAZER = TaamimChar(char="֡", name="Pazer")
+PAZER: Final[TaamimChar] = TaamimChar(char="֡", name="Pazer")
 """An instance of `TaamimChar` representing the Ta'amim **`'֡'`**."""
-TELISHA_GEDOLA = TaamimChar(char="֠", name="Telisha Gedola")
+TELISHA_GEDOLA: Final[TaamimChar] = TaamimChar(char="֠", name="Telisha Gedola")
 """An instance of `TaamimChar` representing the Ta'amim **`'֠'`**."""
-TELISHA_KETANNAH = TaamimChar(char="֩", name="Telisha Ketannah")
+TELISHA_KETANNAH: Final[TaamimChar] = TaamimChar(char="֩", name="Telisha Ketannah")
 """An instance of `TaamimChar` representing the Ta'amim **`'֩'`**."""
-AZLA_GERESH = TaamimChar(char="֜", name="Azla Geresh")
+AZLA_GERESH: Final[TaamimChar] = TaamimChar(char="֜", name="Azla Geresh")
 """An instance of `TaamimChar` representing the Ta'amim **`'֜'`**."""
-GERSHAYIM_2 = TaamimChar(char="֞", name="Gershayim 2")
+GERSHAYIM_2: Final[TaamimChar] = TaamimChar(char="֞", name="Gershayim 2")
 """An instance of `TaamimChar` representing the Ta'amim **`'֞'`**."""
-MERCHA = TaamimChar(char="֥", name="Mercha")
+MERCHA: Final[TaamimChar] = TaamimChar(char="֥", name="Mercha")
 """An instance of `TaamimChar` representing the Ta'amim **`'֥'`**."""
-MUNACH = TaamimChar(char="֣", name="Munach")
+MUNACH: Final[TaamimChar] = TaamimChar(char="֣", name="Munach")
 """An instance of `TaamimChar` representing the Ta'amim **`'֣'`**."""
-MAHPACH = TaamimChar(char="֤", name="Mahpach")
+MAHPACH: Final[TaamimChar] = TaamimChar(char="֤", name="Mahpach")
 """An instance of `TaamimChar` representing the Ta'amim **`'֤'`**."""
-DARGA = TaamimChar(char="֧", name="Darga")
+DARGA: Final[TaamimChar] = TaamimChar(char="֧", name="Darga")
 """An instance of `TaamimChar` representing the Ta'amim **`'֧'`**."""
-MERCHA_KEFULA = TaamimChar(char="֦", name="Mercha Kefula")
+MERCHA_KEFULA: Final[TaamimChar] = TaamimChar(char="֦", name="Mercha Kefula")
 """An instance of `TaamimChar` representing the Ta'amim **`'֦'`**."""
-YERACH_BEN_YOMO = TaamimChar(char="֪", name="Yerach Ben Yomo")
+YERACH_BEN_YOMO: Final[TaamimChar] = TaamimChar(char="֪", name="Yerach Ben Yomo")
 """An instance of `TaamimChar` representing the Ta'amim **`'֪'`**."""
-MASORA = TaamimChar(char="֯", name="Masora")
+MASORA: Final[TaamimChar] = TaamimChar(char="֯", name="Masora")
 """An instance of `TaamimChar` representing the Ta'amim **`'֯'`**."""
-DEHI = TaamimChar(char="֭", name="Dehi")
+DEHI: Final[TaamimChar] = TaamimChar(char="֭", name="Dehi")
 """An instance of `TaamimChar` representing the Ta'amim **`'֭'`**."""
-ZARQA = TaamimChar(char="֘", name="Zarqa")
+ZARQA: Final[TaamimChar] = TaamimChar(char="֘", name="Zarqa")
 """An instance of `TaamimChar` representing the Ta'amim **`'֘'`**."""
-GERESH_MUQDAM = TaamimChar(char="֝", name="Geresh Muqdam")
+GERESH_MUQDAM: Final[TaamimChar] = TaamimChar(char="֝", name="Geresh Muqdam")
 """An instance of `TaamimChar` representing the Ta'amim **`'֝'`**."""
-QARNEY_PARA = TaamimChar(char="֟", name="Qarney Para", name_alts=["Pazer Gadol"])
+QARNEY_PARA: Final[TaamimChar] = TaamimChar(
+    char="֟", name="Qarney Para", name_alts=("Pazer Gadol",)
+)
 """An instance of `TaamimChar` representing the Ta'amim **`'֟'`**."""
-PAZER_GADOL = QARNEY_PARA
+PAZER_GADOL: Final[TaamimChar] = QARNEY_PARA
 """Simple pointer to `QARNEY_PARA` since they share the same Unicode character."""
-OLA = TaamimChar(char="֫", name="Ola")
+OLA: Final[TaamimChar] = TaamimChar(char="֫", name="Ola")
 """An instance of `TaamimChar` representing the Ta'amim **`'֫'`**."""
-ILUY = TaamimChar(char="֬", name="Iluy")
+ILUY: Final[TaamimChar] = TaamimChar(char="֬", name="Iluy")
 """An instance of `TaamimChar` representing the Ta'amim **`'֬'`**."""
-RAFE = TaamimChar(char="ֿ", name="Rafe")
+RAFE: Final[TaamimChar] = TaamimChar(char="ֿ", name="Rafe")
 """An instance of `TaamimChar` representing the Ta'amim **`'ֿ'`**."""
-METEG = TaamimChar(char="ֽ", name="Meteg")
+METEG: Final[TaamimChar] = TaamimChar(char="ֽ", name="Meteg")
 """An instance of `TaamimChar` representing the Ta'amim **`'ֽ'`**."""
-JUDEO_SPANISH_VARIKA = TaamimChar(char="ﬞ", name="Judeo-Spanish Varika")
+JUDEO_SPANISH_VARIKA: Final[TaamimChar] = TaamimChar(
+    char="ﬞ", name="Judeo-Spanish Varika"
+)
 """An instance of `TaamimChar` representing the Ta'amim **`'ﬞ'`**."""
-ATNAH_HAFUKH = TaamimChar(char="֢", name="Atnah Hafukh")
+ATNAH_HAFUKH: Final[TaamimChar] = TaamimChar(char="֢", name="Atnah Hafukh")
 """An instance of `TaamimChar` representing the Ta'amim **`'֢'`**."""
 
-ALL_CHARS: List[Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar]] = [
+ALL_CHARS: Tuple[
+    Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar], ...
+] = (
     ALEPH,
     BET,
     VET,
@@ -1044,18 +1138,18 @@ ALL_CHARS: List[Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar
     YOD_TRIANGLE,
     JUDEO_SPANISH_VARIKA,
     ALTERNATIVE_PLUS_SIGN,
-]
+)
 """
 Every instance of a character class.
-This is used for defining collections with list comprehensions based on the Chars metadata.
+This is used for defining collections with comprehensions based on the Chars metadata.
 It can be relied on as being a complete list of Unicode characters used in Hebrew (and Yiddish etc).
 """
 
-CHARS: Dict[str, Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar]] = {
-    c.char: c for c in ALL_CHARS
-}
+CHARS: Mapping[
+    str, Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar]
+] = MappingProxyType({c.char: c for c in ALL_CHARS})
 """
-A dict of all instances of all supported Char types where the key is the char
+A read only dict of all instances of all supported Char types where the key is the char
 and the value is an instance of BaseHebrewChar.
 This is useful for when you have a hebrew char and want to get its metadata class.
 
@@ -1064,43 +1158,87 @@ assert CHARS['א'] == ALEPH
 ```
 """
 
-FINAL_LETTERS: List[HebrewChar] = [
-    c
-    for c in ALL_CHARS
-    if isinstance(c, HebrewChar) and c.final_letter and len(c.char) == 1
-]
+_CHAR_TYPES: Mapping[str, Type[BaseHebrewChar]] = MappingProxyType(
+    {c.char: type(c) for c in ALL_CHARS}
+)
+"""A read only dict mapping the unicode value of every character to its character class. Used internally by `char_type`."""
+
+
+# The collections below are filled in a single pass over ALL_CHARS, then frozen into tuples.
+_final_letters, _hebrew_chars, _yiddish_chars = [], [], []
+_niqqud_chars, _taamim_chars, _other_chars, _non_letter_chars = [], [], [], []
+for _c in ALL_CHARS:
+    if isinstance(_c, HebrewChar):
+        if _c.final_letter and len(_c.char) == 1:
+            _final_letters.append(_c)
+        if _c.char in "אבגדהוזחטיכךלמםנןסעפףצץקרשת":
+            _hebrew_chars.append(_c)
+    elif isinstance(_c, YiddishChar):
+        if _c.char in ["ױ", "װ", "ײ"]:
+            _yiddish_chars.append(_c)
+    else:
+        _non_letter_chars.append(_c)
+        if isinstance(_c, NiqqudChar):
+            _niqqud_chars.append(_c)
+        elif isinstance(_c, TaamimChar):
+            _taamim_chars.append(_c)
+        elif isinstance(_c, OtherChar):
+            _other_chars.append(_c)
+
+FINAL_LETTERS: Tuple[HebrewChar, ...] = tuple(_final_letters)
 """
-A list of all Hebrew characters that are final letters.
-While we do have letters like 'ףּ' defined, they do not return in this array; it contains only the plain final letters.
+A tuple of all Hebrew characters that are final letters.
+While we do have letters like 'ףּ' defined, they are not included in this tuple; it contains only the plain final letters.
 """
 
-HEBREW_CHARS: List[HebrewChar] = [
-    c
-    for c in ALL_CHARS
-    if isinstance(c, HebrewChar) and c.char in "אבגדהוזחטיכךלמםנןסעפףצץקרשת"
-]
-"""A List of all instances of `HebrewChar`. This will include letters like 'ףּ'"""
+HEBREW_CHARS: Tuple[HebrewChar, ...] = tuple(_hebrew_chars)
+"""A tuple of all instances of `HebrewChar`. This will include letters like 'ףּ'"""
+
+YIDDISH_CHARS: Tuple[YiddishChar, ...] = tuple(_yiddish_chars)
+"""A tuple of all instances of `YiddishChar`."""
+
+NIQQUD_CHARS: Tuple[NiqqudChar, ...] = tuple(_niqqud_chars)
+"""A tuple of all instances of `NiqqudChar`."""
+
+TAAMIM_CHARS: Tuple[TaamimChar, ...] = tuple(_taamim_chars)
+"""A tuple of all instances of `TaamimChar`."""
 
-YIDDISH_CHARS: List[YiddishChar] = [
-    c for c in ALL_CHARS if isinstance(c, YiddishChar) and c.char in ["ױ", "װ", "ײ"]
-]
-"""A List of all instances of `YiddishChar`."""
+OTHER_CHARS: Tuple[OtherChar, ...] = tuple(_other_chars)
+"""A tuple of all instances of `OtherChar`."""
 
-NIQQUD_CHARS: List[NiqqudChar] = [c for c in ALL_CHARS if isinstance(c, NiqqudChar)]
-"""A List of all instances of `NiqqudChar`."""
+FINAL_LETTER_SET: FrozenSet[str] = frozenset(c.char for c in FINAL_LETTERS)
+"""A set of the unicode values of all final letters, for fast membership tests such as `c in FINAL_LETTER_SET`."""
 
-TAAMIM_CHARS: List[TaamimChar] = [c for c in ALL_CHARS if isinstance(c, TaamimChar)]
-"""A List of all instances of `TaamimChar`."""
+HEBREW_CHAR_SET: FrozenSet[str] = frozenset(c.char for c in HEBREW_CHARS)
+"""A set of the unicode values of all `HEBREW_CHARS`, for fast membership tests such as `c in HEBREW_CHAR_SET`."""
 
-OTHER_CHARS: List[OtherChar] = [c for c in ALL_CHARS if isinstance(c, OtherChar)]
-"""A List of all instances of `OtherChar`."""
+YIDDISH_CHAR_SET: FrozenSet[str] = frozenset(c.char for c in YIDDISH_CHARS)
+"""A set of the unicode values of all `YIDDISH_CHARS`, for fast membership tests such as `c in YIDDISH_CHAR_SET`."""
 
-_NON_LETTER_CHARS: List[Union[NiqqudChar, TaamimChar, OtherChar]] = [
-    c
-    for c in ALL_CHARS
-    if not isinstance(c, HebrewChar) and not isinstance(c, YiddishChar)
-]
-"""A List of all chars that are not letters. Used internally for filtering non letter chars."""
+NIQQUD_CHAR_SET: FrozenSet[str] = frozenset(c.char for c in NIQQUD_CHARS)
+"""A set of the unicode values of all `NiqqudChar` instances, for fast membership tests such as `c in NIQQUD_CHAR_SET`."""
+
+TAAMIM_CHAR_SET: FrozenSet[str] = frozenset(c.char for c in TAAMIM_CHARS)
+"""A set of the unicode values of all `TaamimChar` instances, for fast membership tests such as `c in TAAMIM_CHAR_SET`."""
+
+OTHER_CHAR_SET: FrozenSet[str] = frozenset(c.char for c in OTHER_CHARS)
+"""A set of the unicode values of all `OtherChar` instances, for fast membership tests such as `c in OTHER_CHAR_SET`."""
+
+_NON_LETTER_CHARS: Tuple[Union[NiqqudChar, TaamimChar, OtherChar], ...] = tuple(
+    _non_letter_chars
+)
+"""A tuple of all chars that are not letters. Used internally for filtering non letter chars."""
+
+del (
+    _c,
+    _final_letters,
+    _hebrew_chars,
+    _yiddish_chars,
+    _niqqud_chars,
+    _taamim_chars,
+    _other_chars,
+    _non_letter_chars,
+)
 
 FINAL_MINOR_LETTER_MAPPINGS: Dict[str, str] = {
     "כ": "ך",
@@ -1148,7 +1286,7 @@ SPECIAL_CHARACTER_NORMALIZED_MAPPING: Dict[
 def char_search(
     char_name: str,
     char_list: Optional[
-        List[Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar]]
+        Sequence[Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar]]
     ] = None,
 ) -> Optional[Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar]]:
     """
@@ -1159,12 +1297,128 @@ def char_search(
     TODO: Support search in hebrew, which will need to support hebrew text with or without nikud.
 
     :param char_name: A string containing the name of the character to search for.
-    :param char_list: A list of `BaseHebrewChar` characters to use for this search.
+    :param char_list: A sequence of `BaseHebrewChar` characters to use for this search.
     When None, defaults to all characters (ALL_CHARS).
     :return:
     """
     char_list = char_list if char_list else ALL_CHARS
+    for indexed_list, name_index in _NAME_INDEXES:
+        if char_list is indexed_list:
+            return name_index.get(char_name.casefold())
+    char_name = char_name.casefold()
     for char in char_list:
-        if char_name.lower() in [n.lower() for n in char.names]:
-            return CHARS[char.char]
+        if any(char_name == n.casefold() for n in char.names):
+            return char
     return None
+
+
+def char_type(char: str) -> Optional[Type[BaseHebrewChar]]:
+    """
+    Get the character class of a unicode character with a single lookup.
+
+    ``` python
+    assert char_type('א') is HebrewChar
+    assert char_type('ָ') is NiqqudChar
+    ```
+
+    :param char: A string containing the unicode value of the character (as used for the keys of `CHARS`).
+    :return: The class of the character (`HebrewChar`, `YiddishChar`, `NiqqudChar`, `TaamimChar` or `OtherChar`),
+    or `None` if the character is not a known Hebrew character.
+    """
+    return _CHAR_TYPES.get(char)
+
+
+def char_match(
+    text: str, index: int = 0
+) -> Optional[Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar]]:
+    """
+    Find the character that starts at `index` of `text`.
+
+    Some characters such as "בּ" are made up of more than one unicode code point. When more than one character
+    matches at `index`, the longest one is returned.
+
+    ``` python
+    assert char_match('בּית') == BET
+    assert char_match('בּית', 1) == DAGESH
+    ```
+
+    :param text: The string to look in.
+    :param index: The position in `text` to match at. Negative values count from the end of `text`.
+    :return: An instance of the matching character class, or `None` if no character starts at `index`.
+    """
+    if index < 0:
+        index += len(text)
+        if index < 0:
+            return None
+    for char in _CHARS_BY_FIRST_CHAR.get(text[index : index + 1], ()):
+        if text.startswith(char.char, index):
+            return char
+    return None
+
+
+def _build_name_index(
+    char_list: Sequence[
+        Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar]
+    ],
+) -> Dict[str, Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar]]:
+    """
+    Build a lookup of every case folded name (and alt name) to the first character in `char_list` that uses it.
+    The first match wins to preserve the ordering semantics of a linear search over `char_list`.
+    """
+    index = {}
+    for char in char_list:
+        for name in char.names:
+            index.setdefault(sys.intern(name.casefold()), char)
+    return index
+
+
+_NAME_INDEXES: Tuple[
+    Tuple[
+        Tuple[Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar], ...],
+        Dict[str, Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar]],
+    ],
+    ...,
+] = tuple(
+    (char_list, _build_name_index(char_list))
+    for char_list in (
+        ALL_CHARS,
+        HEBREW_CHARS,
+        YIDDISH_CHARS,
+        NIQQUD_CHARS,
+        TAAMIM_CHARS,
+        OTHER_CHARS,
+    )
+)
+"""
+Precomputed name lookups for the module level collections, paired with the collection they were built from.
+`char_search` uses an index only when it is passed that exact (immutable) collection, checked with `is`,
+so it can resolve a name with a single dict lookup instead of scanning every character.
+"""
+
+
+def _build_first_char_index(
+    char_list: Sequence[
+        Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar]
+    ],
+) -> Dict[
+    str, Tuple[Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar], ...]
+]:
+    """
+    Group the characters in `char_list` by their first unicode code point, ordering each group longest first.
+    """
+    index = {}
+    for char in char_list:
+        index.setdefault(char.char[0], []).append(char)
+    return {
+        first: tuple(sorted(chars, key=lambda c: -len(c.char)))
+        for first, chars in index.items()
+    }
+
+
+_CHARS_BY_FIRST_CHAR: Dict[
+    str, Tuple[Union[HebrewChar, YiddishChar, NiqqudChar, TaamimChar, OtherChar], ...]
+] = _build_first_char_index(ALL_CHARS)
+"""
+All characters grouped by their first unicode code point, longest characters first.
+Used by `char_match` to find the longest character at a position of a string.
+"""
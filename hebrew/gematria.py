@@ -5,6 +5,8 @@ from typing import Dict
 class GematriaTypes(Enum):
     """
     Types of Gematria supported in this library.
+
+    Enum members are singletons, so compare them by identity (`method is GematriaTypes.MISPAR_GADOL`).
     """
 
     # Simple methods where the value is calculated off of a value map to each letter
@@ -7,6 +7,7 @@ from hebrew.numerical_conversion.substitute import Substitutions
 
 from .grapheme_string import GraphemeString
 from .chars import (
+    ALL_CHARS,
     MAQAF,
     NIQQUD_CHARS,
     TAAMIM_CHARS,
@@ -14,7 +15,7 @@ from .chars import (
     SOF_PASSUK,
     _NON_LETTER_CHARS,
     CHARS,
-    HEBREW_CHARS,
+    HEBREW_CHAR_SET,
     FINAL_MINOR_LETTER_MAPPINGS,
     HebrewChar,
     SPECIAL_CHARACTER_NORMALIZED_MAPPING,
@@ -25,6 +26,25 @@ from hebrew.gematria import GematriaTypes
 
 HebrewT = TypeVar("HebrewT", bound="Hebrew")
 
+# The characters removed by `text_only`, `no_niqqud` and `no_taamim`, in the order they are removed.
+_NON_LETTER_CHARS_TO_REMOVE: Tuple[str, ...] = tuple(
+    c.char for c in _NON_LETTER_CHARS if c not in (MAQAF, PASEQ)
+)
+_NIQQUD_CHARS_TO_REMOVE: Tuple[str, ...] = tuple(c.char for c in NIQQUD_CHARS)
+_TAAMIM_CHARS_TO_REMOVE: Tuple[str, ...] = tuple(
+    c.char for c in TAAMIM_CHARS if c not in (MAQAF, PASEQ, SOF_PASSUK)
+)
+
+# The value of every character for each simple gematria method, keyed by method and then by character.
+# Looking values up here avoids resolving `base_letter` and the gematria property for every character.
+_SIMPLE_GEMATRIA_VALUES: Dict[GematriaTypes, Dict[str, Optional[int]]] = {
+    method: {
+        c.char: getattr(c, method.value) for c in ALL_CHARS if hasattr(c, method.value)
+    }
+    for method in GematriaTypes
+    if hasattr(HebrewChar, method.value)
+}
+
 
 def get_hebrew_name(letter: HebrewChar, name_dict) -> str:
     """
@@ -101,11 +121,10 @@ class Hebrew(GraphemeString):
         :return:
         """
         string = self.no_maqaf().string if remove_maqaf else self.string
-        chars_to_remove = [c.char for c in _NON_LETTER_CHARS if c not in (MAQAF, PASEQ)]
         string = string.replace(
             f" {PASEQ.char} ", " "
         )  # Handled separately to avoid double spaces.
-        for char in chars_to_remove:
+        for char in _NON_LETTER_CHARS_TO_REMOVE:
             string = string.replace(char, "")
         return Hebrew(string)
 
@@ -117,7 +136,7 @@ class Hebrew(GraphemeString):
         :return:
         """
         string = self.string
-        for char in [c.char for c in NIQQUD_CHARS]:
+        for char in _NIQQUD_CHARS_TO_REMOVE:
             string = string.replace(char, "")
         return Hebrew(string)
 
@@ -165,13 +184,10 @@ class Hebrew(GraphemeString):
         """
         string = self.no_maqaf().string if remove_maqaf else self.string
         string = Hebrew(string).no_sof_passuk().string if remove_sof_passuk else string
-        chars_to_remove = [
-            p.char for p in TAAMIM_CHARS if p not in (MAQAF, PASEQ, SOF_PASSUK)
-        ]
         string = string.replace(
             f" {PASEQ.char} ", " "
         )  # Handled separately to avoid double spaces.
-        for char in chars_to_remove:
+        for char in _TAAMIM_CHARS_TO_REMOVE:
             string = string.replace(char, "")
         return Hebrew(string)
 
@@ -192,22 +208,22 @@ class Hebrew(GraphemeString):
         """
         # Remove non hebrew characters
         cleaned_string: str = "".join(
-            [c for c in self.string if c in [x.char for x in HEBREW_CHARS] or c == " "]
+            [c for c in self.string if c in HEBREW_CHAR_SET or c == " "]
         )
 
-        if method == GematriaTypes.MISPAR_MUSAFI:
+        if method is GematriaTypes.MISPAR_MUSAFI:
             # Mispar Musafi (Heb: מספר מוספי) adds the number of letters in the word or phrase to the value.
             value = self.__calculate_simple_gematria(cleaned_string)
             hebrew_letters = [c for c in cleaned_string if c != " "]
             return value + len(hebrew_letters)
 
-        elif method == GematriaTypes.MISPAR_KOLEL:
+        elif method is GematriaTypes.MISPAR_KOLEL:
             # Mispar Kolel (Heb: מספר כלל) is the value plus the number of words in the phrase.
             value = self.__calculate_simple_gematria(cleaned_string)
             hebrew_words = cleaned_string.split()
             return value + len(hebrew_words)
 
-        elif method == GematriaTypes.MISPAR_BONEEH:
+        elif method is GematriaTypes.MISPAR_BONEEH:
             # Mispar Bone'eh (building value) (Heb: מספר בונה) adds the value of all previous letters in the word to the
             # value of the current letter as the word is calculated. (ex. Echad is 1 + (1 + 8) + (1 + 8 + 4) = 23).
             values = [
@@ -219,11 +235,11 @@ class Hebrew(GraphemeString):
                 total += sum(values[:i]) + n
             return total
 
-        elif method == GematriaTypes.MISPAR_HAMERUBAH_HAKLALI:
+        elif method is GematriaTypes.MISPAR_HAMERUBAH_HAKLALI:
             # Mispar HaMerubah HaKlali (Heb: מספר המרובע הכללי) is the standard value squared.
             return self.__calculate_simple_gematria(cleaned_string) ** 2
 
-        elif method == GematriaTypes.MISPAR_HAACHOR:
+        elif method is GematriaTypes.MISPAR_HAACHOR:
             # Mispar Ha'achor (sometimes called Mispar Meshulash, triangular value) (Heb: מספר האחור) values each letter
             # as its value multiplied by the position of the letter in the word or phrase.
             values = [
@@ -235,7 +251,7 @@ class Hebrew(GraphemeString):
                 total += n * (i + 1)
             return total
 
-        elif method == GematriaTypes.MISPAR_KATAN_MISPARI:
+        elif method is GematriaTypes.MISPAR_KATAN_MISPARI:
             # Mispar Katan Mispari (integral reduced value) (Heb: מספר קטן מספרי) is the digital root of the standard
             # value which is obtained by adding all the digits in the number until the number is a single digit.
             # (ex. Echad (13) --> 1 + 3 --> 4).
@@ -244,7 +260,7 @@ class Hebrew(GraphemeString):
                 calculated_value = sum([int(x) for x in str(calculated_value)])
             return calculated_value
 
-        elif method == GematriaTypes.MISPAR_SHEMI_MILUI:
+        elif method is GematriaTypes.MISPAR_SHEMI_MILUI:
             # Mispar Shemi (Milui, full name value) (Heb: מספר שמי\מילוי) values each letter as the value of the
             # letter's name. (ex. "Aleph" = Aleph + Lamed + Fey = 1 + 30 + 80 = 111).
             # [Note: There is more than one way to spell certain letters.]
@@ -270,7 +286,7 @@ class Hebrew(GraphemeString):
             ]
             return sum(values)
 
-        elif method == GematriaTypes.MISPAR_NEELAM:
+        elif method is GematriaTypes.MISPAR_NEELAM:
             # Mispar Ne'elam (hidden value) (Heb: מספר נעלם) values each letter as the value of the letter's name
             # without the letter itself. (ex. "Aleph" = Lamed + Fey = 30 + 80 = 110).
 
@@ -330,11 +346,10 @@ class Hebrew(GraphemeString):
         string: str, method: GematriaTypes = GematriaTypes.MISPAR_HECHRACHI
     ) -> int:
         """Calculate Gematria for simple Gematria that use a value map for each letter."""
-        chars = [
-            CHARS[c] for c in string if CHARS.get(c) and hasattr(CHARS[c], method.value)
-        ]
-        if len(chars) == 0:
+        char_values = _SIMPLE_GEMATRIA_VALUES.get(method, {})
+        values = [char_values[c] for c in string if c in char_values]
+        if len(values) == 0:
             # The list will be 0 if there are no letters in the string or if the letters are not hebrew.
             return 0
         else:
-            return reduce(add, [getattr(c, method.value) for c in chars])
+            return reduce(add, values)
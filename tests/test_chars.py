@@ -1,4 +1,7 @@
 import collections
+from dataclasses import FrozenInstanceError
+
+import pytest
 
 from hebrew.chars import *
 
@@ -217,6 +220,17 @@ def test_taamim_chars():
         assert type(char) == TaamimChar
 
 
+def test_char_sets():
+    assert NIQQUD_CHAR_SET == {c.char for c in NIQQUD_CHARS}
+    assert TAAMIM_CHAR_SET == {c.char for c in TAAMIM_CHARS}
+    assert OTHER_CHAR_SET == {c.char for c in OTHER_CHARS}
+    assert FINAL_LETTER_SET == {"ץ", "ף", "ן", "ם", "ך"}
+    assert HEBREW_CHAR_SET == {c.char for c in HEBREW_CHARS}
+    assert YIDDISH_CHAR_SET == {"ױ", "װ", "ײ"}
+    assert KUMATZ.char in NIQQUD_CHAR_SET
+    assert ALEPH.char not in NIQQUD_CHAR_SET
+
+
 def test_other_chars():
     assert len(OTHER_CHARS) > 0
     for char in OTHER_CHARS:
@@ -229,6 +243,11 @@ def test_char_dict():
     ), "The _ALL_CHARS array may contain values with duplicate char values"
 
 
+def test_char_dict_read_only():
+    with pytest.raises(TypeError):
+        CHARS["א"] = BET
+
+
 def test_char_search():
     assert isinstance(
         char_search("Aleph"), HebrewChar
@@ -343,3 +362,67 @@ def test_other_char_eq():
     assert other_one == other_one
     assert other_one != other_two
     assert other_one != 5
+
+
+def test_char_search_custom_char_list():
+    custom_list = [GIMEL, ALEPH]
+    assert char_search("Alef", custom_list) == ALEPH
+    assert char_search("Kumatz", custom_list) is None
+    assert char_search("Kumatz", list(NIQQUD_CHARS)) == KUMATZ
+    assert char_search("Alef", list(NIQQUD_CHARS)) is None
+    custom_char = OtherChar(char="a", name="Custom")
+    assert char_search("custom", [custom_char]) is custom_char
+
+
+def test_char_search_first_match():
+    for char_list in (ALL_CHARS, HEBREW_CHARS, NIQQUD_CHARS):
+        for char in char_list:
+            for name in char.names:
+                expected = next(
+                    c for c in char_list if name.lower() in [n.lower() for n in c.names]
+                )
+                assert char_search(name.upper(), char_list) is expected
+
+
+def test_chars_are_frozen():
+    with pytest.raises(FrozenInstanceError):
+        ALEPH.name = "Bad Value"
+
+
+def test_char_type():
+    assert char_type(ALEPH.char) is HebrewChar
+    assert char_type(BET.char) is HebrewChar
+    assert char_type(DOUBLE_VAV.char) is YiddishChar
+    assert char_type(KUMATZ.char) is NiqqudChar
+    assert char_type(SHALSHELET.char) is TaamimChar
+    assert char_type(GERESH.char) is OtherChar
+    assert char_type("a") is None
+    for char in ALL_CHARS:
+        assert char_type(char.char) is type(char)
+
+
+def test_char_match():
+    assert char_match("בּית") == BET
+    assert char_match("בית") == VET
+    assert char_match("בּית", 1) == DAGESH
+    assert char_match(SHIN_DAGESH_SHIN_DOT.char) == SHIN_DAGESH_SHIN_DOT
+    assert char_match("abc") is None
+    assert char_match("") is None
+    assert char_match("שלום", 4) is None
+    assert char_match("שלום", -1) == FINAL_MEM
+    assert char_match("שלום", -4) == CHARS["ש"]
+    assert char_match("שלום", -5) is None
+    for char in ALL_CHARS:
+        assert char_match(f"a{char.char}b", 1) == char
+
+
+def test_hebrew_char_alt_names_accept_none_and_lists():
+    no_alts = HebrewChar(char="א", name="Aleph", name_alts=None, hebrew_name_alts=None)
+    assert no_alts.name_alts == ()
+    assert no_alts.hebrew_name_alts == ()
+    assert no_alts.names == ("Aleph",)
+    list_alts = HebrewChar(
+        char="א", name="Aleph", hebrew_name="אָלֶף", name_alts=["Alef"]
+    )
+    assert list_alts.name_alts == ("Alef",)
+    assert list_alts == ALEPH